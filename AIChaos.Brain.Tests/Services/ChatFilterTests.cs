@@ -0,0 +1,200 @@
+using AIChaos.Brain.Services;
+using AIChaos.Brain.Models;
+
+namespace AIChaos.Brain.Tests.Services;
+
+public class ChatFilterTests
+{
+    private static SafetySettings CreateSafety(bool blockUrls = true, params string[] allowedDomains)
+    {
+        return new SafetySettings
+        {
+            BlockUrls = blockUrls,
+            AllowedDomains = allowedDomains.ToList()
+        };
+    }
+
+    [Fact]
+    public void FilterUrls_RemovesDisallowedUrl()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+
+        // Act
+        var result = ChatFilter.FilterUrls("look at https://evil.example/page", isMod: false, safety);
+
+        // Assert
+        Assert.DoesNotContain("evil.example", result);
+        Assert.Contains("[URL REMOVED]", result);
+    }
+
+    [Fact]
+    public void FilterUrls_KeepsAllowedDomain()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+        var message = "meme https://i.imgur.com/abc.png here";
+
+        // Act
+        var result = ChatFilter.FilterUrls(message, isMod: false, safety);
+
+        // Assert
+        Assert.Equal(message, result);
+    }
+
+    [Fact]
+    public void FilterUrls_DoesNotAllowLookalikeDomain()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+
+        // Act
+        var result = ChatFilter.FilterUrls("https://imgur.com.evil.example/x", isMod: false, safety);
+
+        // Assert
+        Assert.Contains("[URL REMOVED]", result);
+    }
+
+    [Fact]
+    public void FilterUrls_ModeratorBypassesFilter()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+        var message = "check https://evil.example/page";
+
+        // Act
+        var result = ChatFilter.FilterUrls(message, isMod: true, safety);
+
+        // Assert
+        Assert.Equal(message, result);
+    }
+
+    [Fact]
+    public void FilterUrls_DisabledBlockingReturnsMessageUnchanged()
+    {
+        // Arrange
+        var safety = CreateSafety(blockUrls: false);
+        var message = "check https://evil.example/page";
+
+        // Act
+        var result = ChatFilter.FilterUrls(message, isMod: false, safety);
+
+        // Assert
+        Assert.Equal(message, result);
+    }
+
+    [Fact]
+    public void FilterUrls_MessageWithoutUrlIsUnchanged()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+        var message = "just a normal chat message";
+
+        // Act
+        var result = ChatFilter.FilterUrls(message, isMod: false, safety);
+
+        // Assert
+        Assert.Equal(message, result);
+    }
+
+    [Fact]
+    public void FilterUrls_RemovesEveryOccurrenceOfRepeatedUrl()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+
+        // Act
+        var result = ChatFilter.FilterUrls(
+            "https://evil.example/x and again https://evil.example/x", isMod: false, safety);
+
+        // Assert
+        Assert.DoesNotContain("evil.example", result);
+        Assert.Equal(2, result.Split("[URL REMOVED]").Length - 1);
+    }
+
+    [Fact]
+    public void FilterUrls_EmptyWhitelistRemovesAllUrls()
+    {
+        // Arrange
+        var safety = CreateSafety();
+
+        // Act
+        var result = ChatFilter.FilterUrls("https://i.imgur.com/abc.png", isMod: false, safety);
+
+        // Assert
+        Assert.Contains("[URL REMOVED]", result);
+    }
+
+    [Fact]
+    public void FilterUrls_MatchesDomainCaseInsensitively()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+        var message = "https://I.IMGUR.COM/abc.png";
+
+        // Act
+        var result = ChatFilter.FilterUrls(message, isMod: false, safety);
+
+        // Assert
+        Assert.Equal(message, result);
+    }
+
+    [Fact]
+    public void FilterUrls_KeepsAllowedAndRemovesDisallowedInSameMessage()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+
+        // Act
+        var result = ChatFilter.FilterUrls(
+            "good https://i.imgur.com/a.png bad https://evil.example/x end", isMod: false, safety);
+
+        // Assert
+        Assert.Contains("https://i.imgur.com/a.png", result);
+        Assert.DoesNotContain("evil.example", result);
+        Assert.Contains("[URL REMOVED]", result);
+        Assert.EndsWith("end", result);
+    }
+
+    [Fact]
+    public void FilterUrls_RemovesUrlAtEndOfMessage()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+
+        // Act
+        var result = ChatFilter.FilterUrls("see https://evil.example/x", isMod: false, safety);
+
+        // Assert
+        Assert.Equal("see [URL REMOVED]", result);
+    }
+
+    [Fact]
+    public void FilterUrls_IgnoresBareHttpWordWithoutScheme()
+    {
+        // Arrange
+        var safety = CreateSafety(allowedDomains: "imgur.com");
+        var message = "http is a protocol, https too";
+
+        // Act
+        var result = ChatFilter.FilterUrls(message, isMod: false, safety);
+
+        // Assert
+        Assert.Equal(message, result);
+    }
+
+    [Fact]
+    public void ContainsDangerousPatterns_DetectsMapChange()
+    {
+        // Act & Assert
+        Assert.True(ChatFilter.ContainsDangerousPatterns("RunConsoleCommand(\"changelevel\", \"d1_trainstation_01\")"));
+        Assert.True(ChatFilter.ContainsDangerousPatterns("RunConsoleCommand(\"map\", \"gm_flatgrass\")"));
+    }
+
+    [Fact]
+    public void ContainsDangerousPatterns_AllowsHarmlessCode()
+    {
+        // Act & Assert
+        Assert.False(ChatFilter.ContainsDangerousPatterns("print(\"hello chat\")"));
+    }
+}
@@ -333,8 +333,17 @@ public class AccountService
             return (false, _youtubeIndex[youtubeChannelId]);
         }
         
+        // Every verification code starts with "LINK-" (see
+        // GenerateYouTubeLinkCode), so the one-in-thousands message that
+        // could contain a code is identified with a single substring probe
+        // instead of scanning every account's pending code.
+        if (!message.Contains("LINK-", StringComparison.OrdinalIgnoreCase))
+        {
+            return (false, null);
+        }
+
         _logger.LogDebug("[ACCOUNT] Checking message for link code: '{Message}'", message);
-        
+
         // Search for a matching verification code in any account
         foreach (var account in _accounts.Values)
         {
@@ -1,5 +1,6 @@
 using System.Text;
 using System.Text.Json;
+using System.Text.RegularExpressions;
 using AIChaos.Brain.Models;
 
 namespace AIChaos.Brain.Services;
@@ -13,6 +14,11 @@ public class AiCodeGeneratorService
     private readonly SettingsService _settingsService;
     private readonly CommandQueueService _commandQueue;
     private readonly ILogger<AiCodeGeneratorService> _logger;
+
+    // The endpoint only changes when the BaseUrl setting does; cache the
+    // parsed Uri instead of formatting and re-parsing it per request.
+    private string? _chatCompletionsBase;
+    private Uri? _chatCompletionsUri;
     
     /// <summary>
     /// Shared ground rules for GLua code generation that can be used by other services.
@@ -245,7 +251,7 @@ public class AiCodeGeneratorService
                 }
             };
 
-            var request = new HttpRequestMessage(HttpMethod.Post, $"{settings.OpenRouter.BaseUrl}/chat/completions")
+            var request = new HttpRequestMessage(HttpMethod.Post, GetChatCompletionsUri(settings.OpenRouter.BaseUrl))
             {
                 Content = new StringContent(
                     JsonSerializer.Serialize(requestBody),
@@ -339,13 +345,10 @@ public class AiCodeGeneratorService
         }
     }
 
-    /// <summary>
-    /// Checks if code contains dangerous patterns that could break the game.
-    /// These are always blocked, never sent to moderation.
-    /// </summary>
-    private static string? GetDangerousPatternReason(string code)
-    {
-        var dangerousChecks = new Dictionary<string, string>
+    // Pattern tables are compiled once; GenerateCodeAsync runs them against
+    // every AI response, sometimes twice (execution + single-block paths).
+    private static readonly (Regex Pattern, string Reason)[] DangerousChecks =
+        CompileChecks(new Dictionary<string, string>
         {
             [@"changelevel"] = "Map change command (changelevel)",
             [@"RunConsoleCommand.*[""']map[""']"] = "Map change via console (map)",
@@ -372,11 +375,17 @@ public class AiCodeGeneratorService
             [@":Kill\s*\(\s*\)"] = "Instant death (Kill method)",
             [@"TakeDamage\s*\(\s*9999"] = "Extreme damage",
             [@"TakeDamage\s*\(\s*999999"] = "Extreme damage"
-        };
+        });
 
-        foreach (var (pattern, reason) in dangerousChecks)
+    /// <summary>
+    /// Checks if code contains dangerous patterns that could break the game.
+    /// These are always blocked, never sent to moderation.
+    /// </summary>
+    private static string? GetDangerousPatternReason(string code)
+    {
+        foreach (var (pattern, reason) in DangerousChecks)
         {
-            if (System.Text.RegularExpressions.Regex.IsMatch(code, pattern, System.Text.RegularExpressions.RegexOptions.IgnoreCase))
+            if (pattern.IsMatch(code))
             {
                 return reason;
             }
@@ -385,13 +394,8 @@ public class AiCodeGeneratorService
         return null;
     }
 
-    /// <summary>
-    /// Checks if code contains filtered patterns that require moderation.
-    /// Returns the reason if filtered content is found, null otherwise.
-    /// </summary>
-    private static string? GetFilteredPatternReason(string code)
-    {
-        var filteredChecks = new Dictionary<string, string>
+    private static readonly (Regex Pattern, string Reason)[] FilteredChecks =
+        CompileChecks(new Dictionary<string, string>
         {
             // Check for specific URL opening functions first (more specific)
             [@"http\.Fetch\s*\("] = "External HTTP request (http.Fetch)",
@@ -406,11 +410,17 @@ public class AiCodeGeneratorService
             
             // Generic URL pattern (catches any http:// or https://)
             [@"https?://"] = "URL detected in code"
-        };
+        });
 
-        foreach (var (pattern, reason) in filteredChecks)
+    /// <summary>
+    /// Checks if code contains filtered patterns that require moderation.
+    /// Returns the reason if filtered content is found, null otherwise.
+    /// </summary>
+    private static string? GetFilteredPatternReason(string code)
+    {
+        foreach (var (pattern, reason) in FilteredChecks)
         {
-            if (System.Text.RegularExpressions.Regex.IsMatch(code, pattern, System.Text.RegularExpressions.RegexOptions.IgnoreCase))
+            if (pattern.IsMatch(code))
             {
                 return reason;
             }
@@ -419,6 +429,23 @@ public class AiCodeGeneratorService
         return null;
     }
 
+    private Uri GetChatCompletionsUri(string baseUrl)
+    {
+        if (_chatCompletionsUri == null || !string.Equals(baseUrl, _chatCompletionsBase, StringComparison.Ordinal))
+        {
+            _chatCompletionsUri = new Uri($"{baseUrl}/chat/completions");
+            _chatCompletionsBase = baseUrl;
+        }
+        return _chatCompletionsUri;
+    }
+
+    private static (Regex Pattern, string Reason)[] CompileChecks(Dictionary<string, string> checks)
+    {
+        return checks
+            .Select(kvp => (new Regex(kvp.Key, RegexOptions.Compiled | RegexOptions.IgnoreCase), kvp.Value))
+            .ToArray();
+    }
+
     /// <summary>
     /// Checks if code contains dangerous patterns that could break the game.
     /// </summary>
@@ -462,7 +489,7 @@ public class AiCodeGeneratorService
                 }
             };
 
-            var request = new HttpRequestMessage(HttpMethod.Post, $"{settings.OpenRouter.BaseUrl}/chat/completions")
+            var request = new HttpRequestMessage(HttpMethod.Post, GetChatCompletionsUri(settings.OpenRouter.BaseUrl))
             {
                 Content = new StringContent(
                     JsonSerializer.Serialize(requestBody),
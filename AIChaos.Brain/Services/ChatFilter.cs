@@ -0,0 +1,149 @@
+using System.Text;
+using System.Text.RegularExpressions;
+using AIChaos.Brain.Models;
+
+namespace AIChaos.Brain.Services;
+
+/// <summary>
+/// Shared chat filtering helpers used by the Twitch and YouTube services:
+/// URL extraction and whitelisting plus the dangerous-code pattern check.
+/// Everything here is stateless apart from the cached whitelist matcher.
+/// </summary>
+public static class ChatFilter
+{
+    // Compiled once instead of re-parsing the pattern strings for every
+    // generated snippet.
+    private static readonly Regex[] DangerousPatterns = new[]
+    {
+        new Regex("changelevel", RegexOptions.Compiled | RegexOptions.IgnoreCase),
+        new Regex(@"RunConsoleCommand.*""map""", RegexOptions.Compiled | RegexOptions.IgnoreCase),
+        new Regex(@"RunConsoleCommand.*'map'", RegexOptions.Compiled | RegexOptions.IgnoreCase),
+        new Regex(@"game\.ConsoleCommand.*map", RegexOptions.Compiled | RegexOptions.IgnoreCase)
+    };
+
+    // Single-pass suffix matcher over Safety.AllowedDomains, rebuilt only
+    // when the settings list instance changes. NonBacktracking compiles the
+    // alternation into a DFA, so a URL check costs one scan of the host no
+    // matter how large the whitelist grows.
+    private static List<string>? _allowedDomainsSource;
+    private static Regex? _allowedDomainRegex;
+
+    /// <summary>
+    /// Removes non-whitelisted URLs from a chat message. Moderators bypass
+    /// the filter, as does everyone when URL blocking is disabled.
+    /// </summary>
+    public static string FilterUrls(string message, bool isMod, SafetySettings safety)
+    {
+        if (!safety.BlockUrls || isMod)
+        {
+            return message;
+        }
+
+        // Single pass over the message: locate each http(s):// scheme, take
+        // the URL up to the next whitespace, and test its host against the
+        // whitelist DFA. No regex match collection, no repeated
+        // string.Replace re-scans, and no allocation at all for the
+        // overwhelmingly common case of a message without URLs.
+        var start = NextUrlStart(message, 0);
+        if (start < 0)
+        {
+            return message;
+        }
+
+        var allowedDomains = AllowedDomainMatcher(safety);
+        StringBuilder? result = null;
+        var copied = 0;
+
+        while (start >= 0)
+        {
+            var end = start;
+            while (end < message.Length && !char.IsWhiteSpace(message[end]))
+            {
+                end++;
+            }
+
+            var url = message.AsSpan(start, end - start);
+            if (allowedDomains == null || !allowedDomains.IsMatch(ExtractHost(url)))
+            {
+                result ??= new StringBuilder(message.Length);
+                result.Append(message, copied, start - copied);
+                result.Append("[URL REMOVED]");
+                copied = end;
+            }
+
+            start = NextUrlStart(message, end);
+        }
+
+        if (result == null)
+        {
+            return message;
+        }
+
+        result.Append(message, copied, message.Length - copied);
+        return result.ToString();
+    }
+
+    private static int NextUrlStart(string message, int from)
+    {
+        while (true)
+        {
+            var idx = message.IndexOf("http", from, StringComparison.OrdinalIgnoreCase);
+            if (idx < 0)
+            {
+                return -1;
+            }
+
+            var rest = idx + 4;
+            if (rest < message.Length && (message[rest] == 's' || message[rest] == 'S'))
+            {
+                rest++;
+            }
+
+            if (rest + 2 < message.Length
+                && message[rest] == ':' && message[rest + 1] == '/' && message[rest + 2] == '/')
+            {
+                return idx;
+            }
+
+            from = idx + 4;
+        }
+    }
+
+    /// <summary>
+    /// Checks generated code for patterns that could break the game
+    /// (map changes and the like).
+    /// </summary>
+    public static bool ContainsDangerousPatterns(string code)
+    {
+        return DangerousPatterns.Any(pattern => pattern.IsMatch(code));
+    }
+
+    private static Regex? AllowedDomainMatcher(SafetySettings safety)
+    {
+        var source = safety.AllowedDomains;
+        if (!ReferenceEquals(source, _allowedDomainsSource))
+        {
+            _allowedDomainRegex = source.Count == 0
+                ? null
+                : new Regex(
+                    "(?:" + string.Join("|", source.Select(d => Regex.Escape(d.ToLowerInvariant()))) + ")$",
+                    RegexOptions.NonBacktracking | RegexOptions.IgnoreCase);
+            _allowedDomainsSource = source;
+        }
+        return _allowedDomainRegex;
+    }
+
+    private static ReadOnlySpan<char> ExtractHost(ReadOnlySpan<char> url)
+    {
+        var start = url.IndexOf("://", StringComparison.Ordinal);
+        start = start < 0 ? 0 : start + 3;
+
+        var end = start;
+        while (end < url.Length && url[end] != '/' && url[end] != ':' && url[end] != '?' && url[end] != '#')
+        {
+            end++;
+        }
+
+        return url[start..end];
+    }
+}
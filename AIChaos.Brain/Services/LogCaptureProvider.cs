@@ -33,6 +33,11 @@ public class LogCaptureLogger : ILogger
     private readonly string _categoryName;
     private readonly LogCaptureService _logCaptureService;
 
+    // Debug/Trace fire per chat message in the hot paths; declining them in
+    // IsEnabled means the framework never formats those messages for this
+    // provider, instead of formatting and enqueueing every one.
+    private const LogLevel MinCaptureLevel = LogLevel.Information;
+
     public LogCaptureLogger(string categoryName, LogCaptureService logCaptureService)
     {
         _categoryName = categoryName;
@@ -46,7 +51,7 @@ public class LogCaptureLogger : ILogger
 
     public bool IsEnabled(LogLevel logLevel)
     {
-        return logLevel != LogLevel.None;
+        return logLevel >= MinCaptureLevel && logLevel != LogLevel.None;
     }
 
     public void Log<TState>(
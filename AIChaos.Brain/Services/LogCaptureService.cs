@@ -56,9 +56,19 @@ public class LogCaptureService
 /// </summary>
 public class LogEntry
 {
+    private string? _timestampDisplay;
+
     public DateTime Timestamp { get; set; }
     public LogLevel Level { get; set; }
     public string Category { get; set; } = "";
     public string Message { get; set; } = "";
     public string? Exception { get; set; }
+
+    /// <summary>
+    /// Timestamp formatted for the logs view. An entry never changes once
+    /// captured, so the string is formatted once instead of on every render
+    /// of the (up to 1000-entry) log list.
+    /// </summary>
+    public string TimestampDisplay =>
+        _timestampDisplay ??= Timestamp.ToLocalTime().ToString("yyyy-MM-dd HH:mm:ss.fff");
 }
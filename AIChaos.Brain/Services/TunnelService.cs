@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Diagnostics;
 using System.Text.RegularExpressions;
 using AIChaos.Brain.Models;
@@ -14,7 +15,23 @@ public partial class TunnelService : IDisposable
     private readonly HttpClient _httpClient;
     
     private Process? _tunnelProcess;
-    
+
+    // The shared HttpClient (factory-managed handler pool) already keeps
+    // connections alive across calls; caching the endpoint URIs also avoids
+    // re-parsing the same strings on every probe/retry.
+    private static readonly Uri NgrokApiUri = new("http://localhost:4040/api/tunnels");
+    private static readonly Uri IpifyUri = new("https://api.ipify.org");
+    private static readonly Uri IcanhazipUri = new("https://icanhazip.com");
+
+    // Resolved once on first use - these probe a list of candidate paths with
+    // filesystem stats, which there is no reason to repeat per tunnel start.
+    private static readonly Lazy<string?> LuaFilePath = new(FindLuaFile);
+    private static readonly Lazy<string?> RepoRootDir = new(FindRepoRoot);
+
+    // Full paths of tunnel executables, resolved once per name so repeated
+    // launches (version check + actual start) don't re-walk PATH.
+    private static readonly System.Collections.Concurrent.ConcurrentDictionary<string, string> ExecutablePaths = new();
+
     public bool IsRunning => _tunnelProcess != null && !_tunnelProcess.HasExited;
     public string? CurrentUrl { get; private set; }
     public TunnelType CurrentType { get; private set; } = TunnelType.None;
@@ -33,206 +50,151 @@ public partial class TunnelService : IDisposable
     /// <summary>
     /// Starts an ngrok tunnel.
     /// </summary>
-    public async Task<(bool Success, string? Url, string? Error)> StartNgrokAsync()
+    public Task<(bool Success, string? Url, string? Error)> StartNgrokAsync()
     {
-        if (IsRunning)
-        {
-            return (false, null, "A tunnel is already running. Stop it first.");
-        }
-        
-        try
-        {
-            // Check if ngrok is installed
-            var checkResult = await RunCommandAsync("ngrok", "version");
-            if (!checkResult.Success)
-            {
-                return (false, null, "ngrok is not installed. Please install it from https://ngrok.com/download and run 'ngrok config add-authtoken YOUR_TOKEN' to configure it.");
-            }
-            
-            // Start ngrok
-            _tunnelProcess = new Process
-            {
-                StartInfo = new ProcessStartInfo
-                {
-                    FileName = "ngrok",
-                    Arguments = "http 5000",
-                    UseShellExecute = false,
-                    RedirectStandardOutput = true,
-                    RedirectStandardError = true,
-                    CreateNoWindow = true
-                }
-            };
-            
-            _tunnelProcess.Start();
-            _logger.LogInformation("ngrok started with PID {Pid}", _tunnelProcess.Id);
-            
-            // Wait for ngrok to initialize and get URL from API
-            await Task.Delay(3000);
-            
-            var url = await GetNgrokUrlAsync();
-            if (url == null)
-            {
-                Stop();
-                return (false, null, "Failed to get ngrok URL. Make sure ngrok is properly configured with 'ngrok config add-authtoken YOUR_TOKEN'.");
-            }
-            
-            CurrentUrl = url;
-            CurrentType = TunnelType.Ngrok;
-            
-            // Update settings
-            var tunnel = _settingsService.Settings.Tunnel;
-            tunnel.Type = TunnelType.Ngrok;
-            tunnel.CurrentUrl = url;
-            tunnel.IsRunning = true;
-            _settingsService.UpdateTunnel(tunnel);
-            
-            // Update Lua file
-            await UpdateLuaFileAsync(url);
-            
-            return (true, url, null);
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Failed to start ngrok");
-            return (false, null, ex.Message);
-        }
+        return StartTunnelCoreAsync(
+            TunnelType.Ngrok,
+            executable: "ngrok",
+            arguments: "http 5000",
+            checkArguments: "version",
+            notInstalledError: "ngrok is not installed. Please install it from https://ngrok.com/download and run 'ngrok config add-authtoken YOUR_TOKEN' to configure it.",
+            urlFailureError: "Failed to get ngrok URL. Make sure ngrok is properly configured with 'ngrok config add-authtoken YOUR_TOKEN'.",
+            beforeStart: null,
+            getUrl: GetNgrokUrlAsync,
+            // The URL comes from ngrok's local API, so its output is never
+            // read - drain it so the pipe buffer can't fill and block the
+            // child. Inheriting the console instead is not an option: ngrok
+            // v3 detects a TTY and draws its full-screen UI over our output.
+            drainOutput: true);
     }
-    
+
     /// <summary>
     /// Starts a localtunnel.
     /// </summary>
-    public async Task<(bool Success, string? Url, string? Error)> StartLocalTunnelAsync()
+    public Task<(bool Success, string? Url, string? Error)> StartLocalTunnelAsync()
     {
-        if (IsRunning)
-        {
-            return (false, null, "A tunnel is already running. Stop it first.");
-        }
-        
-        try
-        {
-            // Check if localtunnel is installed
-            var checkResult = await RunCommandAsync("lt", "--version");
-            if (!checkResult.Success)
-            {
-                return (false, null, "localtunnel is not installed. Install it with: npm install -g localtunnel");
-            }
-            
-            // Get public IP for localtunnel password
-            await GetPublicIpAsync();
-            
-            // Start localtunnel
-            _tunnelProcess = new Process
-            {
-                StartInfo = new ProcessStartInfo
-                {
-                    FileName = "lt",
-                    Arguments = "--port 5000",
-                    UseShellExecute = false,
-                    RedirectStandardOutput = true,
-                    RedirectStandardError = true,
-                    CreateNoWindow = true
-                }
-            };
-            
-            _tunnelProcess.Start();
-            _logger.LogInformation("localtunnel started with PID {Pid}", _tunnelProcess.Id);
-            
-            // Read output to get URL
-            var url = await GetLocalTunnelUrlAsync();
-            if (url == null)
-            {
-                Stop();
-                return (false, null, "Failed to get localtunnel URL.");
-            }
-            
-            CurrentUrl = url;
-            CurrentType = TunnelType.LocalTunnel;
-            
-            // Update settings
-            var tunnel = _settingsService.Settings.Tunnel;
-            tunnel.Type = TunnelType.LocalTunnel;
-            tunnel.CurrentUrl = url;
-            tunnel.IsRunning = true;
-            _settingsService.UpdateTunnel(tunnel);
-            
-            // Update Lua file
-            await UpdateLuaFileAsync(url);
-            
-            return (true, url, null);
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Failed to start localtunnel");
-            return (false, null, ex.Message);
-        }
+        return StartTunnelCoreAsync(
+            TunnelType.LocalTunnel,
+            executable: "lt",
+            arguments: "--port 5000",
+            checkArguments: "--version",
+            notInstalledError: "localtunnel is not installed. Install it with: npm install -g localtunnel",
+            urlFailureError: "Failed to get localtunnel URL.",
+            beforeStart: GetPublicIpAsync, // Get public IP for localtunnel password
+            getUrl: GetLocalTunnelUrlAsync);
     }
-    
+
     /// <summary>
     /// Starts a Bore tunnel (bore.pub).
     /// </summary>
-    public async Task<(bool Success, string? Url, string? Error)> StartBoreAsync()
+    public Task<(bool Success, string? Url, string? Error)> StartBoreAsync()
+    {
+        return StartTunnelCoreAsync(
+            TunnelType.Bore,
+            executable: "bore",
+            arguments: "local 5000 --to bore.pub",
+            checkArguments: "--version",
+            notInstalledError: "bore is not installed. Install it with: cargo install bore-cli (requires Rust)",
+            urlFailureError: "Failed to get bore URL. Make sure bore.pub is accessible.",
+            beforeStart: null,
+            getUrl: GetBoreUrlAsync);
+    }
+
+    /// <summary>
+    /// Shared start flow for all tunnel backends: availability check, process
+    /// launch, URL discovery, settings update, and Lua file update. The
+    /// per-backend differences are parameterized so a fix or optimization here
+    /// applies to ngrok, localtunnel, and bore at once.
+    /// </summary>
+    private async Task<(bool Success, string? Url, string? Error)> StartTunnelCoreAsync(
+        TunnelType type,
+        string executable,
+        string arguments,
+        string checkArguments,
+        string notInstalledError,
+        string urlFailureError,
+        Func<Task>? beforeStart,
+        Func<Task<string?>> getUrl,
+        bool drainOutput = false)
     {
         if (IsRunning)
         {
             return (false, null, "A tunnel is already running. Stop it first.");
         }
-        
+
         try
         {
-            // Check if bore is installed
-            var checkResult = await RunCommandAsync("bore", "--version");
+            // Check if the tunnel executable is installed
+            var checkResult = await RunCommandAsync(executable, checkArguments);
             if (!checkResult.Success)
             {
-                return (false, null, "bore is not installed. Install it with: cargo install bore-cli (requires Rust)");
+                return (false, null, notInstalledError);
             }
-            
-            // Start bore - bore local <port> --to bore.pub
+
+            if (beforeStart != null)
+            {
+                await beforeStart();
+            }
+
             _tunnelProcess = new Process
             {
                 StartInfo = new ProcessStartInfo
                 {
-                    FileName = "bore",
-                    Arguments = "local 5000 --to bore.pub",
+                    FileName = ResolveExecutable(executable),
+                    Arguments = arguments,
                     UseShellExecute = false,
                     RedirectStandardOutput = true,
                     RedirectStandardError = true,
                     CreateNoWindow = true
                 }
             };
-            
+
             _tunnelProcess.Start();
-            _logger.LogInformation("bore started with PID {Pid}", _tunnelProcess.Id);
-            
-            // Read output to get URL (bore outputs to stderr)
-            var url = await GetBoreUrlAsync();
+            _logger.LogInformation("{Executable} started with PID {Pid}", executable, _tunnelProcess.Id);
+
+            if (drainOutput)
+            {
+                // Nothing ever reads this backend's streams, so pump them
+                // into no-op handlers to keep the pipe buffers empty.
+                _tunnelProcess.OutputDataReceived += DiscardLine;
+                _tunnelProcess.ErrorDataReceived += DiscardLine;
+                _tunnelProcess.BeginOutputReadLine();
+                _tunnelProcess.BeginErrorReadLine();
+            }
+
+            var url = await getUrl();
             if (url == null)
             {
                 Stop();
-                return (false, null, "Failed to get bore URL. Make sure bore.pub is accessible.");
+                return (false, null, urlFailureError);
             }
-            
+
             CurrentUrl = url;
-            CurrentType = TunnelType.Bore;
-            
+            CurrentType = type;
+
             // Update settings
             var tunnel = _settingsService.Settings.Tunnel;
-            tunnel.Type = TunnelType.Bore;
+            tunnel.Type = type;
             tunnel.CurrentUrl = url;
             tunnel.IsRunning = true;
             _settingsService.UpdateTunnel(tunnel);
-            
+
             // Update Lua file
             await UpdateLuaFileAsync(url);
-            
+
             return (true, url, null);
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, "Failed to start bore");
+            _logger.LogError(ex, "Failed to start {Executable}", executable);
             return (false, null, ex.Message);
         }
     }
-    
+
+    private static void DiscardLine(object sender, DataReceivedEventArgs e)
+    {
+    }
+
     /// <summary>
     /// Stops the current tunnel.
     /// </summary>
@@ -303,11 +265,18 @@ public partial class TunnelService : IDisposable
     
     private async Task<string?> GetNgrokUrlAsync()
     {
-        for (int i = 0; i < 10; i++)
+        // Poll the local ngrok API with exponentially growing backoff instead
+        // of a fixed startup sleep - ngrok is often ready within a few hundred
+        // milliseconds, so the first probes come fast and the interval backs
+        // off for slow starts.
+        var deadline = Environment.TickCount64 + 15_000;
+        var delay = 50;
+
+        while (Environment.TickCount64 < deadline)
         {
             try
             {
-                var response = await _httpClient.GetAsync("http://localhost:4040/api/tunnels");
+                var response = await _httpClient.GetAsync(NgrokApiUri);
                 if (response.IsSuccessStatusCode)
                 {
                     var json = await response.Content.ReadAsStringAsync();
@@ -325,7 +294,8 @@ public partial class TunnelService : IDisposable
             {
                 // Ignore and retry
             }
-            await Task.Delay(1000);
+            await Task.Delay(delay);
+            delay = Math.Min(delay * 2, 500);
         }
         return null;
     }
@@ -333,121 +303,199 @@ public partial class TunnelService : IDisposable
     private async Task<string?> GetLocalTunnelUrlAsync()
     {
         if (_tunnelProcess == null) return null;
-        
-        var timeout = DateTime.UtcNow.AddSeconds(30);
-        while (DateTime.UtcNow < timeout)
+
+        var urlFound = new TaskCompletionSource<string?>(TaskCreationOptions.RunContinuationsAsynchronously);
+        var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
+        cts.Token.Register(() => urlFound.TrySetResult(null));
+
+        // Watch both streams like the bore reader does - the URL arrives on
+        // stdout, but startup failures only show on stderr, and either stream
+        // ending tells us the process died without waiting out the timeout.
+        var stdoutTask = ScanStreamForLocalTunnelUrlAsync(_tunnelProcess.StandardOutput, urlFound, cts.Token);
+        var stderrTask = ScanStreamForLocalTunnelUrlAsync(_tunnelProcess.StandardError, urlFound, cts.Token);
+
+        _ = Task.WhenAll(stdoutTask, stderrTask).ContinueWith(
+            _ => urlFound.TrySetResult(null), TaskScheduler.Default);
+
+        var url = await urlFound.Task;
+        cts.Cancel(); // Stop reading
+
+        if (url == null)
         {
-            if (_tunnelProcess.HasExited)
-            {
-                return null;
-            }
-            
-            var line = await _tunnelProcess.StandardOutput.ReadLineAsync();
-            if (!string.IsNullOrEmpty(line))
-            {
-                _logger.LogDebug("localtunnel output: {Line}", line);
-                var match = UrlRegex().Match(line);
-                if (match.Success)
-                {
-                    return match.Value;
-                }
-            }
+            _logger.LogWarning("localtunnel URL detection timed out or the process exited before printing a URL");
         }
-        return null;
+        return url;
     }
-    
-    private async Task<string?> GetBoreUrlAsync()
+
+    private async Task ScanStreamForLocalTunnelUrlAsync(StreamReader reader, TaskCompletionSource<string?> urlFound, CancellationToken ct)
     {
-        if (_tunnelProcess == null) return null;
-        
-        var output = new System.Text.StringBuilder();
-        var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
-        
+        // Read in batches into a pooled buffer rather than line by line -
+        // ReadLineAsync allocates a fresh string per line and scans for the
+        // terminator char-by-char, and all we want is the first URL. Each
+        // chunk is scanned (and logged) exactly once; only a small carry is
+        // kept between reads to catch a URL split across chunk boundaries.
+        var buffer = ArrayPool<char>.Shared.Rent(4096);
+        var carry = string.Empty;
         try
         {
-            // Read from both stdout and stderr concurrently with timeout
-            // Bore can output to either stream depending on version
-            var stdoutTask = ReadStreamWithTimeoutAsync(_tunnelProcess.StandardOutput, output, cts.Token);
-            var stderrTask = ReadStreamWithTimeoutAsync(_tunnelProcess.StandardError, output, cts.Token);
-            
-            // Wait for either task to find a URL or timeout
-            while (!cts.Token.IsCancellationRequested)
+            while (!ct.IsCancellationRequested && !urlFound.Task.IsCompleted)
             {
-                if (_tunnelProcess.HasExited)
+                var charsRead = await reader.ReadAsync(buffer.AsMemory(0, 4096), ct);
+                if (charsRead == 0)
                 {
-                    _logger.LogWarning("bore process exited prematurely");
+                    // Stream ended - accept a URL that ran to the end of the output
+                    var finalUrl = ExtractHttpsUrl(carry);
+                    if (finalUrl != null)
+                    {
+                        urlFound.TrySetResult(finalUrl);
+                    }
                     break;
                 }
-                
-                // Check current output for bore URL
-                var currentOutput = output.ToString();
-                if (!string.IsNullOrEmpty(currentOutput))
+
+                var chunk = new string(buffer, 0, charsRead);
+                _logger.LogDebug("localtunnel output: {Output}", chunk);
+
+                var text = carry.Length == 0 ? chunk : carry + chunk;
+                var start = text.IndexOf("https://", StringComparison.Ordinal);
+                if (start >= 0)
                 {
-                    _logger.LogDebug("bore output: {Output}", currentOutput);
-                    var match = BorePortRegex().Match(currentOutput);
-                    if (match.Success)
+                    var end = start;
+                    while (end < text.Length && !char.IsWhiteSpace(text[end]))
                     {
-                        var port = match.Groups[1].Value;
-                        cts.Cancel(); // Stop reading
-                        return $"http://bore.pub:{port}";
+                        end++;
                     }
+
+                    // Only accept a URL terminated inside the chunk; one that
+                    // runs to the end may still be arriving in the next read,
+                    // so keep it as the carry instead.
+                    if (end < text.Length)
+                    {
+                        urlFound.TrySetResult(text[start..end]);
+                        break;
+                    }
+
+                    carry = text[start..];
+                }
+                else
+                {
+                    // Keep just enough tail to catch a scheme split across
+                    // chunk boundaries.
+                    var keep = Math.Min("https://".Length - 1, text.Length);
+                    carry = text[^keep..];
                 }
-                
-                await Task.Delay(500, cts.Token);
             }
         }
         catch (OperationCanceledException)
         {
-            _logger.LogWarning("bore URL detection timed out. Output received: {Output}", output.ToString());
+            // Expected when we find the URL or timeout
+        }
+        catch (Exception ex)
+        {
+            _logger.LogDebug("Error reading localtunnel stream: {Error}", ex.Message);
+        }
+        finally
+        {
+            ArrayPool<char>.Shared.Return(buffer);
         }
-        
-        return null;
     }
     
-    private async Task ReadStreamWithTimeoutAsync(StreamReader reader, System.Text.StringBuilder output, CancellationToken ct)
+    private async Task<string?> GetBoreUrlAsync()
     {
-        var buffer = new char[1024];
+        var process = _tunnelProcess;
+        if (process == null) return null;
+
+        // Let the runtime deliver output lines as they arrive instead of
+        // dedicating reader tasks to pump the streams. Bore can print to
+        // either stream depending on version, so both are watched; a process
+        // exit completes the wait early instead of running out the timeout.
+        var urlFound = new TaskCompletionSource<string?>(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        void OnLine(object sender, DataReceivedEventArgs e)
+        {
+            if (string.IsNullOrEmpty(e.Data)) return;
+
+            _logger.LogDebug("bore output: {Line}", e.Data);
+            var port = ExtractBorePort(e.Data);
+            if (port != null)
+            {
+                urlFound.TrySetResult($"http://bore.pub:{port}");
+            }
+        }
+
+        process.OutputDataReceived += OnLine;
+        process.ErrorDataReceived += OnLine;
+        process.EnableRaisingEvents = true;
+        process.Exited += (_, _) => urlFound.TrySetResult(null);
+
         try
         {
-            while (!ct.IsCancellationRequested)
+            process.BeginOutputReadLine();
+            process.BeginErrorReadLine();
+
+            var url = await urlFound.Task.WaitAsync(TimeSpan.FromSeconds(30));
+            if (url == null)
             {
-                // Use a small buffer read that won't block forever
-                var readTask = reader.ReadAsync(buffer, 0, buffer.Length);
-                var completedTask = await Task.WhenAny(readTask, Task.Delay(100, ct));
-                
-                if (completedTask == readTask)
-                {
-                    var bytesRead = await readTask;
-                    if (bytesRead > 0)
-                    {
-                        lock (output)
-                        {
-                            output.Append(buffer, 0, bytesRead);
-                        }
-                    }
-                    else
-                    {
-                        // Stream ended
-                        break;
-                    }
-                }
+                _logger.LogWarning("bore process exited before printing a URL");
             }
+            return url;
         }
-        catch (OperationCanceledException)
+        catch (TimeoutException)
         {
-            // Expected when we find the URL or timeout
+            _logger.LogWarning("bore URL detection timed out");
+            return null;
         }
-        catch (Exception ex)
+        finally
         {
-            _logger.LogDebug("Error reading bore stream: {Error}", ex.Message);
+            process.OutputDataReceived -= OnLine;
+            process.ErrorDataReceived -= OnLine;
         }
     }
     
+    /// <summary>
+    /// Extracts the first https:// URL from a line of localtunnel output
+    /// ("your url is: https://xxxx.loca.lt"). The format is fixed, so a
+    /// substring search plus whitespace scan beats the regex engine on the
+    /// per-line hot path.
+    /// </summary>
+    private static string? ExtractHttpsUrl(string line)
+    {
+        var start = line.IndexOf("https://", StringComparison.Ordinal);
+        if (start < 0) return null;
+
+        var end = start;
+        while (end < line.Length && !char.IsWhiteSpace(line[end]))
+        {
+            end++;
+        }
+        return line[start..end];
+    }
+
+    /// <summary>
+    /// Extracts the port from bore's "listening at bore.pub:PORT" output.
+    /// The format is fixed, so a plain substring search plus digit scan is
+    /// cheaper than running the regex engine on every accumulated chunk.
+    /// </summary>
+    private static string? ExtractBorePort(string output)
+    {
+        const string marker = "bore.pub:";
+        var start = output.IndexOf(marker, StringComparison.OrdinalIgnoreCase);
+        if (start < 0) return null;
+
+        var digitsStart = start + marker.Length;
+        var end = digitsStart;
+        while (end < output.Length && char.IsAsciiDigit(output[end]))
+        {
+            end++;
+        }
+
+        return end > digitsStart ? output[digitsStart..end] : null;
+    }
+
     private async Task GetPublicIpAsync()
     {
         try
         {
-            var response = await _httpClient.GetAsync("https://api.ipify.org");
+            var response = await _httpClient.GetAsync(IpifyUri);
             if (response.IsSuccessStatusCode)
             {
                 PublicIp = (await response.Content.ReadAsStringAsync()).Trim();
@@ -461,7 +509,7 @@ public partial class TunnelService : IDisposable
         
         try
         {
-            var response = await _httpClient.GetAsync("https://icanhazip.com");
+            var response = await _httpClient.GetAsync(IcanhazipUri);
             if (response.IsSuccessStatusCode)
             {
                 PublicIp = (await response.Content.ReadAsStringAsync()).Trim();
@@ -483,30 +531,7 @@ public partial class TunnelService : IDisposable
 
         return; // we don't need to update the Lua file anymore, just the tunnel_url.txt
 
-        // Try multiple possible paths to find the Lua file
-        var possiblePaths = new[]
-        {
-            // Relative to the project directory (when running from source)
-            Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..", "lua", "autorun", "ai_chaos_controller.lua"),
-            Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "lua", "autorun", "ai_chaos_controller.lua"),
-            Path.Combine(AppContext.BaseDirectory, "..", "..", "lua", "autorun", "ai_chaos_controller.lua"),
-            Path.Combine(AppContext.BaseDirectory, "..", "lua", "autorun", "ai_chaos_controller.lua"),
-            // Relative to current working directory
-            Path.Combine(Directory.GetCurrentDirectory(), "..", "lua", "autorun", "ai_chaos_controller.lua"),
-            Path.Combine(Directory.GetCurrentDirectory(), "lua", "autorun", "ai_chaos_controller.lua"),
-        };
-        
-        string? luaPath = null;
-        foreach (var path in possiblePaths)
-        {
-            var fullPath = Path.GetFullPath(path);
-            if (File.Exists(fullPath))
-            {
-                luaPath = fullPath;
-                break;
-            }
-        }
-        
+        var luaPath = LuaFilePath.Value;
         if (luaPath == null)
         {
             _logger.LogWarning("Lua file not found in any expected location. GMod addon should be in ../lua/ relative to AIChaos.Brain");
@@ -516,17 +541,47 @@ public partial class TunnelService : IDisposable
         
         try
         {
-            var content = await File.ReadAllTextAsync(luaPath);
-            
-            // Update BASE_URL (without /poll)
+            // Fast path: patch the two URL lines in place when the new text
+            // fits inside the existing lines, instead of rewriting the file.
+            if (await TryUpdateLuaFileInPlaceAsync(luaPath, url, pollUrl))
+            {
+                _logger.LogInformation("Updated Lua file with URL: {Url}", pollUrl);
+                _logger.LogInformation("Lua file location: {Path}", luaPath);
+                return;
+            }
+
+            // Stream the file line-by-line into a temp file and swap it into
+            // place, so memory stays O(line) instead of O(filesize) and a
+            // crash mid-write can't leave a truncated script behind.
+            var tmpPath = luaPath + ".tmp";
             var baseUrlLine = $"    local BASE_URL = \"{url}\" -- Auto-configured by launcher";
-            content = BaseUrlRegex().Replace(content, baseUrlLine);
-            
-            // Update SERVER_URL (with /poll)
             var serverUrlLine = $"    local SERVER_URL = \"{pollUrl}\" -- Auto-configured by launcher";
-            content = ServerUrlRegex().Replace(content, serverUrlLine);
-            
-            await File.WriteAllTextAsync(luaPath, content);
+
+            using (var src = new StreamReader(luaPath))
+            await using (var dst = new StreamWriter(tmpPath))
+            {
+                string? line;
+                while ((line = await src.ReadLineAsync()) != null)
+                {
+                    // The target lines are effectively anchored, so a plain
+                    // prefix check beats running the regex engine on every line.
+                    var trimmed = line.TrimStart();
+                    if (trimmed.StartsWith("local BASE_URL = \"", StringComparison.Ordinal))
+                    {
+                        await dst.WriteLineAsync(baseUrlLine);
+                    }
+                    else if (trimmed.StartsWith("local SERVER_URL = \"", StringComparison.Ordinal))
+                    {
+                        await dst.WriteLineAsync(serverUrlLine);
+                    }
+                    else
+                    {
+                        await dst.WriteLineAsync(line);
+                    }
+                }
+            }
+
+            File.Move(tmpPath, luaPath, overwrite: true);
             _logger.LogInformation("Updated Lua file with URL: {Url}", pollUrl);
             _logger.LogInformation("Lua file location: {Path}", luaPath);
         }
@@ -536,49 +591,87 @@ public partial class TunnelService : IDisposable
         }
     }
     
+    /// <summary>
+    /// Patches the BASE_URL/SERVER_URL lines in place when the replacements fit
+    /// within the existing lines, writing only the changed byte ranges rather
+    /// than round-tripping the whole file through a string. Returns false when
+    /// either line is missing or too short, in which case the caller falls back
+    /// to the full read/replace/write path.
+    /// </summary>
+    private static async Task<bool> TryUpdateLuaFileInPlaceAsync(string luaPath, string url, string pollUrl)
+    {
+        var content = await File.ReadAllBytesAsync(luaPath);
+
+        var basePatch = BuildLinePatch(content, "local BASE_URL = ",
+            $"local BASE_URL = \"{url}\" -- Auto-configured by launcher");
+        var serverPatch = BuildLinePatch(content, "local SERVER_URL = ",
+            $"local SERVER_URL = \"{pollUrl}\" -- Auto-configured by launcher");
+
+        if (basePatch == null || serverPatch == null)
+        {
+            return false;
+        }
+
+        using var handle = File.OpenHandle(luaPath, FileMode.Open, FileAccess.Write);
+        RandomAccess.Write(handle, basePatch.Value.Bytes, basePatch.Value.Offset);
+        RandomAccess.Write(handle, serverPatch.Value.Bytes, serverPatch.Value.Offset);
+        return true;
+    }
+
+    private static (long Offset, byte[] Bytes)? BuildLinePatch(byte[] content, string marker, string newLine)
+    {
+        var start = content.AsSpan().IndexOf(System.Text.Encoding.UTF8.GetBytes(marker));
+        if (start < 0) return null;
+
+        var end = Array.IndexOf(content, (byte)'\n', start);
+        if (end < 0) end = content.Length;
+
+        // Don't overwrite the \r of a Windows line ending
+        if (end > start && content[end - 1] == (byte)'\r') end--;
+
+        var replacement = System.Text.Encoding.UTF8.GetBytes(newLine);
+        if (replacement.Length > end - start) return null;
+
+        // Pad the remainder of the old line with spaces so stale text is cleared
+        var patch = new byte[end - start];
+        replacement.CopyTo(patch, 0);
+        for (var i = replacement.Length; i < patch.Length; i++)
+        {
+            patch[i] = (byte)' ';
+        }
+
+        return (start, patch);
+    }
+
     private async Task WriteTunnelUrlFileAsync(string baseUrl)
     {
-        // Write to tunnel_url.txt in multiple locations for compatibility
         // Note: We write the BASE URL (without /poll) - the Lua script appends /poll when reading
-        var possibleDirs = new[]
-        {
-            // Root of repository (where the old Python scripts would write it)
-            Path.Combine(AppContext.BaseDirectory, "..", "..", "..", ".."),
-            Path.Combine(AppContext.BaseDirectory, "..", "..", ".."),
-            Path.Combine(AppContext.BaseDirectory, "..", ".."),
-            Path.Combine(AppContext.BaseDirectory, ".."),
-            // Current working directory
-            Directory.GetCurrentDirectory(),
-            Path.Combine(Directory.GetCurrentDirectory(), ".."),
-        };
-        
-        foreach (var dir in possibleDirs)
+        // The payload is ~40 bytes, so encode it once and write the raw bytes
+        // (create/truncate in one call) instead of going through the buffered
+        // text-writer stack.
+        var payload = System.Text.Encoding.UTF8.GetBytes(baseUrl);
+
+        var repoRoot = RepoRootDir.Value;
+        if (repoRoot != null)
         {
             try
             {
-                var fullDir = Path.GetFullPath(dir);
-                var tunnelUrlPath = Path.Combine(fullDir, "tunnel_url.txt");
-                
-                // Only write to directories that exist and where the lua folder exists (indicates repo root)
-                var luaDir = Path.Combine(fullDir, "lua");
-                if (Directory.Exists(fullDir) && Directory.Exists(luaDir))
-                {
-                    await File.WriteAllTextAsync(tunnelUrlPath, baseUrl);
-                    _logger.LogInformation("Written tunnel URL to: {Path}", tunnelUrlPath);
-                    return;
-                }
+                var tunnelUrlPath = Path.Combine(repoRoot, "tunnel_url.txt");
+                await File.WriteAllBytesAsync(tunnelUrlPath, payload);
+                _logger.LogInformation("Written tunnel URL to: {Path}", tunnelUrlPath);
+                return;
             }
             catch (Exception ex)
             {
-                _logger.LogDebug("Could not write tunnel_url.txt to {Dir}: {Error}", dir, ex.Message);
+                _logger.LogDebug("Could not write tunnel_url.txt to {Dir}: {Error}", repoRoot, ex.Message);
             }
         }
-        
+
         // Fallback: write to current directory
         try
         {
             var fallbackPath = Path.Combine(Directory.GetCurrentDirectory(), "tunnel_url.txt");
-            await File.WriteAllTextAsync(fallbackPath, baseUrl);
+            await File.WriteAllBytesAsync(fallbackPath, payload);
             _logger.LogInformation("Written tunnel URL to fallback location: {Path}", fallbackPath);
         }
         catch (Exception ex)
@@ -586,7 +679,95 @@ public partial class TunnelService : IDisposable
             _logger.LogWarning("Failed to write tunnel_url.txt: {Error}", ex.Message);
         }
     }
-    
+
+    /// <summary>
+    /// Resolves an executable name to its full path by walking PATH (plus
+    /// PATHEXT on Windows), caching the result so repeated launches skip the
+    /// directory walk. Falls back to the bare name when not found so the OS
+    /// can report its usual error.
+    /// </summary>
+    private static string ResolveExecutable(string name)
+    {
+        return ExecutablePaths.GetOrAdd(name, static n =>
+        {
+            var pathVar = Environment.GetEnvironmentVariable("PATH") ?? "";
+            var extensions = OperatingSystem.IsWindows()
+                ? (Environment.GetEnvironmentVariable("PATHEXT") ?? ".EXE;.CMD;.BAT;.COM").Split(';', StringSplitOptions.RemoveEmptyEntries)
+                : new[] { "" };
+
+            foreach (var dir in pathVar.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries))
+            {
+                foreach (var ext in extensions)
+                {
+                    var candidate = Path.Combine(dir, n + ext);
+                    if (File.Exists(candidate))
+                    {
+                        return candidate;
+                    }
+                }
+            }
+            return n;
+        });
+    }
+
+    /// <summary>
+    /// Finds the GMod Lua controller script. The layout can't change while the
+    /// process is running, so the candidate paths are only probed once.
+    /// </summary>
+    private static string? FindLuaFile()
+    {
+        var possiblePaths = new[]
+        {
+            // Relative to the project directory (when running from source)
+            Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..", "lua", "autorun", "ai_chaos_controller.lua"),
+            Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "lua", "autorun", "ai_chaos_controller.lua"),
+            Path.Combine(AppContext.BaseDirectory, "..", "..", "lua", "autorun", "ai_chaos_controller.lua"),
+            Path.Combine(AppContext.BaseDirectory, "..", "lua", "autorun", "ai_chaos_controller.lua"),
+            // Relative to current working directory
+            Path.Combine(Directory.GetCurrentDirectory(), "..", "lua", "autorun", "ai_chaos_controller.lua"),
+            Path.Combine(Directory.GetCurrentDirectory(), "lua", "autorun", "ai_chaos_controller.lua"),
+        };
+
+        foreach (var path in possiblePaths)
+        {
+            var fullPath = Path.GetFullPath(path);
+            if (File.Exists(fullPath))
+            {
+                return fullPath;
+            }
+        }
+        return null;
+    }
+
+    /// <summary>
+    /// Finds the repository root (identified by its lua/ folder) where
+    /// tunnel_url.txt lives, matching where the old Python scripts wrote it.
+    /// </summary>
+    private static string? FindRepoRoot()
+    {
+        var possibleDirs = new[]
+        {
+            Path.Combine(AppContext.BaseDirectory, "..", "..", "..", ".."),
+            Path.Combine(AppContext.BaseDirectory, "..", "..", ".."),
+            Path.Combine(AppContext.BaseDirectory, "..", ".."),
+            Path.Combine(AppContext.BaseDirectory, ".."),
+            // Current working directory
+            Directory.GetCurrentDirectory(),
+            Path.Combine(Directory.GetCurrentDirectory(), ".."),
+        };
+
+        foreach (var dir in possibleDirs)
+        {
+            var fullDir = Path.GetFullPath(dir);
+            if (Directory.Exists(fullDir) && Directory.Exists(Path.Combine(fullDir, "lua")))
+            {
+                return fullDir;
+            }
+        }
+        return null;
+    }
+
+
     private async Task<(bool Success, string Output)> RunCommandAsync(string command, string arguments)
     {
         try
@@ -595,7 +776,7 @@ public partial class TunnelService : IDisposable
             {
                 StartInfo = new ProcessStartInfo
                 {
-                    FileName = command,
+                    FileName = ResolveExecutable(command),
                     Arguments = arguments,
                     UseShellExecute = false,
                     RedirectStandardOutput = true,
@@ -619,19 +800,6 @@ public partial class TunnelService : IDisposable
     
     [GeneratedRegex(@"""public_url""\s*:\s*""(https?://[^""]+)""")]
     private static partial Regex NgrokUrlRegex();
-    
-    [GeneratedRegex(@"https://[^\s]+")]
-    private static partial Regex UrlRegex();
-    
-    [GeneratedRegex(@"bore\.pub:(\d+)")]
-    private static partial Regex BorePortRegex();
-    
-    [GeneratedRegex(@"local BASE_URL = "".*?"".*")]
-    private static partial Regex BaseUrlRegex();
-    
-    [GeneratedRegex(@"local SERVER_URL = "".*?"".*")]
-    private static partial Regex ServerUrlRegex();
-    
     public void Dispose()
     {
         Stop();
@@ -1,4 +1,4 @@
-using System.Text.RegularExpressions;
+using System.Threading.Channels;
 using AIChaos.Brain.Models;
 using TwitchLib.Client;
 using TwitchLib.Client.Events;
@@ -11,7 +11,7 @@ namespace AIChaos.Brain.Services;
 /// <summary>
 /// Service for Twitch chat integration with OAuth support.
 /// </summary>
-public partial class TwitchService : IDisposable
+public class TwitchService : IDisposable
 {
     private readonly SettingsService _settingsService;
     private readonly CommandQueueService _commandQueue;
@@ -19,7 +19,32 @@ public partial class TwitchService : IDisposable
     private readonly ILogger<TwitchService> _logger;
     
     private TwitchClient? _client;
-    private readonly Dictionary<string, DateTime> _cooldowns = new();
+    private TaskCompletionSource<bool>? _connectedSignal;
+
+    // Commands flow through a bounded channel drained by a single worker:
+    // the chat callback stays O(1), a burst is processed in arrival order,
+    // and a raid can't fan out one thread-pool task per command. With the
+    // default Wait full mode, TryWrite reports failure on a full channel
+    // instead of silently discarding the item, so the overflow is logged.
+    private readonly Channel<(string Username, string Prompt)> _commandChannel =
+        Channel.CreateBounded<(string Username, string Prompt)>(new BoundedChannelOptions(64)
+        {
+            FullMode = BoundedChannelFullMode.Wait
+        });
+
+    // Keyed by username with a case-insensitive comparer (no per-lookup
+    // lowercase allocation), values are Environment.TickCount64 expiry
+    // stamps: monotonic, so NTP/wall-clock adjustments can't shorten or
+    // extend a cooldown. Bounded by the periodic expired-entry sweep.
+    private readonly Dictionary<string, long> _cooldowns = new(StringComparer.OrdinalIgnoreCase);
+    private int _cooldownSweepCounter;
+    private const int MaxCooldownEntries = 4096;
+
+    // Snapshot of Safety.Moderators as a case-insensitive set, rebuilt only
+    // when the underlying list instance changes, so the per-message check is
+    // a single hash lookup instead of an O(N) case-sensitive list scan.
+    private List<string>? _moderatorsSource;
+    private HashSet<string> _moderators = new(StringComparer.OrdinalIgnoreCase);
     
     public bool IsConnected => _client?.IsConnected ?? false;
     public string? ConnectedChannel { get; private set; }
@@ -34,6 +59,7 @@ public partial class TwitchService : IDisposable
         _commandQueue = commandQueue;
         _codeGenerator = codeGenerator;
         _logger = logger;
+        _ = Task.Run(ProcessCommandChannelAsync);
     }
     
     /// <summary>
@@ -66,11 +92,20 @@ public partial class TwitchService : IDisposable
             _client.OnMessageReceived += OnMessageReceived;
             _client.OnError += OnError;
             
+            _connectedSignal = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
             _client.Connect();
-            
-            // Wait a bit for connection
-            await Task.Delay(2000);
-            
+
+            // Wait for the connected event instead of a fixed two-second
+            // delay; most connections complete in well under a second.
+            try
+            {
+                await _connectedSignal.Task.WaitAsync(TimeSpan.FromSeconds(5));
+            }
+            catch (TimeoutException)
+            {
+                // Fall through and report the client's actual state.
+            }
+
             if (_client.IsConnected)
             {
                 ConnectedChannel = settings.Channel;
@@ -110,28 +145,47 @@ public partial class TwitchService : IDisposable
     private void OnConnected(object? sender, OnConnectedArgs e)
     {
         _logger.LogInformation("Twitch client connected as {BotUsername}", e.BotUsername);
+        _connectedSignal?.TrySetResult(true);
     }
     
-    private async void OnMessageReceived(object? sender, OnMessageReceivedArgs e)
+    private void OnMessageReceived(object? sender, OnMessageReceivedArgs e)
     {
         var settings = _settingsService.Settings.Twitch;
         var message = e.ChatMessage;
-        
+
+        // Read the message properties once up front; they are consulted
+        // several times below (command check, prompt slice, logging).
+        var text = message.Message;
+        var command = settings.ChatCommand;
+
+        // Almost every chat line is not a command. A length check plus an
+        // ASCII case-folded first-character probe rejects those before the
+        // full case-insensitive prefix comparison.
+        if (string.IsNullOrEmpty(text) || text.Length < command.Length)
+        {
+            return;
+        }
+
+        if (command.Length > 0 && (text[0] | 0x20) != (command[0] | 0x20))
+        {
+            return;
+        }
+
         // Check if message starts with the command
-        if (!message.Message.StartsWith(settings.ChatCommand, StringComparison.OrdinalIgnoreCase))
+        if (!text.StartsWith(command, StringComparison.OrdinalIgnoreCase))
         {
             return;
         }
-        
+
         // Extract the prompt
-        var prompt = message.Message[settings.ChatCommand.Length..].Trim();
+        var prompt = text[command.Length..].Trim();
         if (string.IsNullOrEmpty(prompt))
         {
             return;
         }
-        
+
         var username = message.Username;
-        
+
         // Get bits from the message
         var bits = message.Bits;
         
@@ -147,36 +201,54 @@ public partial class TwitchService : IDisposable
         }
         
         // Check cooldown
-        if (IsOnCooldown(username, settings.CooldownSeconds))
+        if (IsOnCooldown(username))
         {
             _logger.LogInformation("[Twitch] User {Username} is on cooldown", username);
             return;
         }
         
         // Filter URLs if not moderator
-        var isMod = message.IsModerator || message.IsBroadcaster;
-        var filteredPrompt = FilterUrls(prompt, isMod, _settingsService.Settings.Safety);
-        
-        // Generate and queue the code
+        var isMod = message.IsModerator || message.IsBroadcaster || IsConfiguredModerator(username);
+        var filteredPrompt = ChatFilter.FilterUrls(prompt, isMod, _settingsService.Settings.Safety);
+
+        // Hand the slow part (AI generation) off to the background worker so
+        // the TwitchLib event callback returns immediately and the client
+        // keeps pumping messages during bursts.
+        SetCooldown(username);
+        if (!_commandChannel.Writer.TryWrite((username, filteredPrompt)))
+        {
+            _logger.LogWarning("[Twitch] Command queue is full, dropping command from {Username}", username);
+        }
+    }
+
+    private async Task ProcessCommandChannelAsync()
+    {
+        await foreach (var (username, prompt) in _commandChannel.Reader.ReadAllAsync())
+        {
+            await ProcessCommandAsync(username, prompt);
+        }
+    }
+
+    private async Task ProcessCommandAsync(string username, string filteredPrompt)
+    {
         try
         {
             var (executionCode, undoCode, needsModeration, moderationReason) = await _codeGenerator.GenerateCodeAsync(filteredPrompt);
-            
+
             // Check for dangerous code patterns
-            if (ContainsDangerousPatterns(executionCode))
+            if (ChatFilter.ContainsDangerousPatterns(executionCode))
             {
                 _logger.LogWarning("[Twitch] Blocked dangerous code from {Username}", username);
                 return;
             }
-            
+
             _commandQueue.AddCommand(
-                filteredPrompt, 
-                executionCode, 
-                undoCode, 
-                "twitch", 
+                filteredPrompt,
+                executionCode,
+                undoCode,
+                "twitch",
                 username);
-            
-            SetCooldown(username);
+
             _logger.LogInformation("[Twitch] Command queued from {Username}: {Prompt}", username, filteredPrompt);
         }
         catch (Exception ex)
@@ -190,76 +262,52 @@ public partial class TwitchService : IDisposable
         _logger.LogError(e.Exception, "Twitch client error");
     }
     
-    private bool IsOnCooldown(string username, int cooldownSeconds)
+    private bool IsConfiguredModerator(string username)
     {
-        if (_cooldowns.TryGetValue(username.ToLowerInvariant(), out var lastCommand))
+        var source = _settingsService.Settings.Safety.Moderators;
+        if (!ReferenceEquals(source, _moderatorsSource))
         {
-            return (DateTime.UtcNow - lastCommand).TotalSeconds < cooldownSeconds;
+            _moderators = new HashSet<string>(source, StringComparer.OrdinalIgnoreCase);
+            _moderatorsSource = source;
         }
-        return false;
+        return _moderators.Contains(username);
     }
-    
-    private void SetCooldown(string username)
+
+    private bool IsOnCooldown(string username)
     {
-        _cooldowns[username.ToLowerInvariant()] = DateTime.UtcNow;
+        // Values are expiry stamps, so the hot check is a single hash probe
+        // and one comparison.
+        return _cooldowns.TryGetValue(username, out var expires) && Environment.TickCount64 < expires;
     }
-    
-    private static string FilterUrls(string message, bool isMod, SafetySettings safety)
+
+    private void SetCooldown(string username)
     {
-        if (!safety.BlockUrls || isMod)
+        _cooldowns[username] = Environment.TickCount64 + _settingsService.Settings.Twitch.CooldownSeconds * 1000L;
+
+        // Long streams accumulate one entry per chatter. Sweep expired
+        // entries every so often so the dictionary stays bounded.
+        if ((++_cooldownSweepCounter & 0xFF) == 0 || _cooldowns.Count > MaxCooldownEntries)
         {
-            return message;
+            PruneExpiredCooldowns();
         }
-        
-        var urlPattern = UrlRegex();
-        var matches = urlPattern.Matches(message);
-        var filtered = message;
-        
-        foreach (Match match in matches)
+    }
+
+    private void PruneExpiredCooldowns()
+    {
+        var now = Environment.TickCount64;
+        foreach (var (user, expires) in _cooldowns)
         {
-            var url = match.Value;
-            try
-            {
-                var uri = new Uri(url);
-                var domain = uri.Host.ToLowerInvariant();
-                
-                var isAllowed = safety.AllowedDomains.Any(d => 
-                    domain.Contains(d, StringComparison.OrdinalIgnoreCase));
-                
-                if (!isAllowed)
-                {
-                    filtered = filtered.Replace(url, "[URL REMOVED]");
-                }
-            }
-            catch
+            if (expires < now)
             {
-                filtered = filtered.Replace(url, "[URL REMOVED]");
+                _cooldowns.Remove(user);
             }
         }
-        
-        return filtered;
     }
-    
-    private static bool ContainsDangerousPatterns(string code)
-    {
-        var dangerousPatterns = new[]
-        {
-            "changelevel",
-            @"RunConsoleCommand.*""map""",
-            @"RunConsoleCommand.*'map'",
-            @"game\.ConsoleCommand.*map"
-        };
-        
-        return dangerousPatterns.Any(pattern => 
-            Regex.IsMatch(code, pattern, RegexOptions.IgnoreCase));
-    }
-    
-    [GeneratedRegex(@"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")]
-    private static partial Regex UrlRegex();
-    
+
     public void Dispose()
     {
         Disconnect();
+        _commandChannel.Writer.TryComplete();
         GC.SuppressFinalize(this);
     }
 }
@@ -1,4 +1,3 @@
-using System.Text.RegularExpressions;
 using AIChaos.Brain.Models;
 using Google.Apis.Auth.OAuth2;
 using Google.Apis.Services;
@@ -10,7 +9,7 @@ namespace AIChaos.Brain.Services;
 /// <summary>
 /// Service for YouTube Live Chat integration with OAuth support.
 /// </summary>
-public partial class YouTubeService : IDisposable
+public class YouTubeService : IDisposable
 {
     private readonly SettingsService _settingsService;
     private readonly CommandQueueService _commandQueue;
@@ -22,7 +21,13 @@ public partial class YouTubeService : IDisposable
     private Google.Apis.YouTube.v3.YouTubeService? _youtubeService;
     private CancellationTokenSource? _cancellationTokenSource;
     private Task? _pollingTask;
-    private readonly Dictionary<string, DateTime> _cooldowns = new();
+    // Keyed by username with a case-insensitive comparer (no per-lookup
+    // lowercase allocation), values are Environment.TickCount64 expiry
+    // stamps: monotonic, so NTP/wall-clock adjustments can't shorten or
+    // extend a cooldown. Bounded by the expired-entry sweep on insert.
+    private readonly Dictionary<string, long> _cooldowns = new(StringComparer.OrdinalIgnoreCase);
+    private int _cooldownSweepCounter;
+    private const int MaxCooldownEntries = 4096;
     private readonly SemaphoreSlim _listenerLock = new(1, 1);
     private bool _isPolling = false;
 
@@ -257,9 +262,12 @@ public partial class YouTubeService : IDisposable
                 var response = await request.ExecuteAsync(cancellationToken);
                 nextPageToken = response.NextPageToken;
 
-                foreach (var message in response.Items ?? [])
+                if (response.Items is { Count: > 0 })
                 {
-                    ProcessMessageAsync(message);
+                    // Messages on a page are processed concurrently; the loop
+                    // awaits the batch so exceptions are observed and the next
+                    // poll doesn't race unfinished credit/currency work.
+                    await Task.WhenAll(response.Items.Select(ProcessMessageAsync));
                 }
 
                 // Wait before next poll - use the configured interval (in milliseconds)
@@ -339,10 +347,14 @@ public partial class YouTubeService : IDisposable
             // Get the amount in the original currency (converted from micros)
             originalAmount = (decimal)(snippet.SuperChatDetails.AmountMicros ?? 0) / 1_000_000m;
             currencyCode = snippet.SuperChatDetails.Currency;
-            
-            // Convert to USD
-            superChatAmountUsd = await _currencyConverter.ConvertToUsdAsync(originalAmount, currencyCode ?? "USD");
-            
+
+            // Convert to USD. A zero amount skips the converter entirely,
+            // which avoids a pointless exchange-rate refresh round-trip.
+            if (originalAmount > 0)
+            {
+                superChatAmountUsd = await _currencyConverter.ConvertToUsdAsync(originalAmount, currencyCode ?? "USD");
+            }
+
             messageText = snippet.SuperChatDetails.UserComment ?? messageText;
         }
 
@@ -368,73 +380,35 @@ public partial class YouTubeService : IDisposable
         }
     }
 
-    private bool IsOnCooldown(string username, int cooldownSeconds)
+    private bool IsOnCooldown(string username)
     {
-        if (_cooldowns.TryGetValue(username.ToLowerInvariant(), out var lastCommand))
-        {
-            return (DateTime.UtcNow - lastCommand).TotalSeconds < cooldownSeconds;
-        }
-        return false;
+        // Values are expiry stamps, so the hot check is a single hash probe
+        // and one comparison.
+        return _cooldowns.TryGetValue(username, out var expires) && Environment.TickCount64 < expires;
     }
 
     private void SetCooldown(string username)
     {
-        _cooldowns[username.ToLowerInvariant()] = DateTime.UtcNow;
-    }
+        _cooldowns[username] = Environment.TickCount64 + _settingsService.Settings.YouTube.CooldownSeconds * 1000L;
 
-    private static string FilterUrls(string message, bool isMod, SafetySettings safety)
-    {
-        if (!safety.BlockUrls || isMod)
+        if ((++_cooldownSweepCounter & 0xFF) == 0 || _cooldowns.Count > MaxCooldownEntries)
         {
-            return message;
+            PruneExpiredCooldowns();
         }
+    }
 
-        var urlPattern = UrlRegex();
-        var matches = urlPattern.Matches(message);
-        var filtered = message;
-
-        foreach (Match match in matches)
+    private void PruneExpiredCooldowns()
+    {
+        var now = Environment.TickCount64;
+        foreach (var (user, expires) in _cooldowns)
         {
-            var url = match.Value;
-            try
+            if (expires < now)
             {
-                var uri = new Uri(url);
-                var domain = uri.Host.ToLowerInvariant();
-
-                var isAllowed = safety.AllowedDomains.Any(d =>
-                    domain.Contains(d, StringComparison.OrdinalIgnoreCase));
-
-                if (!isAllowed)
-                {
-                    filtered = filtered.Replace(url, "[URL REMOVED]");
-                }
-            }
-            catch
-            {
-                filtered = filtered.Replace(url, "[URL REMOVED]");
+                _cooldowns.Remove(user);
             }
         }
-
-        return filtered;
-    }
-
-    private static bool ContainsDangerousPatterns(string code)
-    {
-        var dangerousPatterns = new[]
-        {
-            "changelevel",
-            @"RunConsoleCommand.*""map""",
-            @"RunConsoleCommand.*'map'",
-            @"game\.ConsoleCommand.*map"
-        };
-
-        return dangerousPatterns.Any(pattern =>
-            Regex.IsMatch(code, pattern, RegexOptions.IgnoreCase));
     }
 
-    [GeneratedRegex(@"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")]
-    private static partial Regex UrlRegex();
-
     public void Dispose()
     {
         StopListening();